@@ -11,19 +11,27 @@ Endpoints:
   GET  /api/status               -> per-service state + raw docker status/health
   POST /api/service/<key>/<action>  (action: start|stop|restart)
   GET  /api/sysinfo              -> disk/ram/cpu metrics from the host
+                                    (?fmt=human for formatted byte sizes)
 """
 
 from __future__ import annotations
 
 import os
+import threading
 import time
-from typing import Dict, Any, Tuple
+from concurrent.futures import Future
+from typing import Callable, Dict, Any, Optional, Tuple
 
 # Ensure psutil reads host /proc instead of container's /proc
 os.environ.setdefault("PSUTIL_PROCFS_PATH", "/hostproc")
+PROCFS_PATH = os.environ["PSUTIL_PROCFS_PATH"]
+MEMINFO_PATH = os.path.join(PROCFS_PATH, "meminfo")
+LOADAVG_PATH = os.path.join(PROCFS_PATH, "loadavg")
 
+import orjson
 import psutil  # type: ignore
-from flask import Flask, jsonify, abort, make_response
+from flask import Flask, jsonify, abort, make_response, request
+from flask.json.provider import JSONProvider
 import docker  # type: ignore
 from docker.errors import NotFound, APIError
 
@@ -31,7 +39,18 @@ from docker.errors import NotFound, APIError
 # Configuration
 # -----------------------------------------------------------------------------
 
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson (C encoder/decoder)."""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 docker_client = docker.from_env()
 
 # Comma-separated whitelist of service *container names* allowed to be exposed.
@@ -56,6 +75,16 @@ SERVICES: Dict[str, Dict[str, str]] = {
     "vpn": {"container": "vpn"},
 }
 
+# (key, container name) pairs exposed by /api/status. SERVICES and ALLOWED are
+# fixed at startup, so the filtering is done once here.
+_VISIBLE: Tuple[Tuple[str, str], ...] = tuple(
+    (key, meta["container"]) for key, meta in SERVICES.items() if meta["container"] in ALLOWED
+)
+_VISIBLE_NAMES: list[str] = sorted({name for _, name in _VISIBLE})
+
+# Shared /api/status entry for services whose container does not exist.
+_UNKNOWN_SERVICE: Dict[str, Any] = {"state": "unknown"}
+
 # Normalize Docker container states to a small, UI-friendly set.
 HEALTH_MAP: Dict[str, str] = {
     "running": "active",
@@ -69,6 +98,76 @@ HEALTH_MAP: Dict[str, str] = {
 
 HOSTFS_PATH = "/hostfs"  # mount a host filesystem root here (read-only is fine)
 
+# How long (seconds) an encoded /api/status body is served from cache.
+# Absorbs polling from several dashboard tabs without re-querying Docker.
+STATUS_TTL = float(os.environ.get("SB_STATUS_TTL", "1.0"))
+
+# "ts" is -inf while nothing valid is cached: it can never look fresh, whatever
+# the host uptime (time.monotonic() counts from boot) or SB_STATUS_TTL.
+# "gen" is bumped on every invalidation so a body assembled from a snapshot
+# taken before the invalidation is never stored (see _build_status_body()).
+_STATUS_CACHE: Dict[str, Any] = {"ts": float("-inf"), "body": b"", "gen": 0}
+_STATUS_LOCK = threading.Lock()
+
+# Interval (seconds) of the background CPU sampler feeding /api/sysinfo.
+CPU_SAMPLE_INTERVAL = 1.0
+
+_LAST_CPU_PCT: float = 0.0
+
+# (state, health) as tracked per container, e.g. ("running", "healthy").
+ContainerState = Tuple[str, Optional[str]]
+
+# Container states kept up to date from the Docker events stream. Only trusted
+# while _STATE_READY is set; otherwise status() queries Docker directly.
+_STATE: Dict[str, ContainerState] = {}
+_STATE_LOCK = threading.Lock()
+_STATE_READY = threading.Event()
+
+# Containers known to have a healthcheck (seen reporting health in a listing or
+# a health_status event). Kept across exits so a later start reports "starting".
+_HAS_HEALTHCHECK: set[str] = set()
+
+# Set once the watcher's first seeding attempt has finished (successfully or
+# not). Until then a cold /api/status waits up to COLD_START_WAIT seconds for
+# that in-flight listing instead of issuing a second one.
+_FIRST_SEED_DONE = threading.Event()
+COLD_START_WAIT = 1.0
+
+# service_action waits until the container is in one of these states (restart:
+# the "restart" event) before returning, up to ACTION_CONFIRM_TIMEOUT seconds.
+# Docker answers start/stop on a container already in such a state with a 304
+# and emits no event, so these also count as done before waiting.
+_ACTION_STATES: Dict[str, frozenset[str]] = {
+    "start": frozenset({"running", "restarting", "paused"}),
+    "stop": frozenset({"created", "exited", "dead"}),
+}
+ACTION_CONFIRM_TIMEOUT = 1.0
+
+# Pending service_action confirmations: container name -> [(action, event)].
+_WAITERS: Dict[str, list[Tuple[str, threading.Event]]] = {}
+
+# Delay (seconds) before reconnecting to the Docker events stream.
+EVENTS_RETRY_DELAY = 2.0
+
+# Container event actions that change the state reported by Docker.
+_EVENT_STATES: Dict[str, str] = {
+    "create": "created",
+    "start": "running",
+    "restart": "running",
+    "unpause": "running",
+    "pause": "paused",
+    "die": "exited",  # fallback; _apply_event() inspects for the real state
+    "stop": "exited",
+}
+
+# Health as embedded at the end of a running container's summary status,
+# e.g. "Up 2 hours (healthy)" or "Up 3 seconds (health: starting)".
+_HEALTH_SUFFIXES: Dict[str, str] = {
+    "(healthy)": "healthy",
+    "(unhealthy)": "unhealthy",
+    "(health: starting)": "starting",
+}
+
 # -----------------------------------------------------------------------------
 # Helpers
 # -----------------------------------------------------------------------------
@@ -87,29 +186,394 @@ def _map_status(state: str, health: str | None) -> str:
     return mapped
 
 
-def _container_status(container_name: str) -> Tuple[str, Dict[str, Any]]:
+def _summary_health(state: str, status: str) -> Optional[str]:
+    """
+    Extract health from a container summary status string. Only running
+    containers report health, always as the trailing parenthesised suffix.
+    """
+    if state != "running" or not status.endswith(")"):
+        return None
+    return _HEALTH_SUFFIXES.get(status[status.rfind("("):])
+
+
+def _list_containers() -> Dict[str, ContainerState]:
     """
-    Return (mapped_status, raw_dict) for a container by name.
+    Fetch (state, health) for all visible containers in a single Docker API call.
+    Returns a dict keyed by container name (without the leading "/").
+    """
+    # The "name" filter matches substrings, so exact names are resolved by the
+    # dict lookup in _container_status().
+    summaries = docker_client.api.containers(all=True, filters={"name": _VISIBLE_NAMES})
+    out: Dict[str, ContainerState] = {}
+    for summary in summaries:
+        state = summary.get("State") or "unknown"
+        entry = (state, _summary_health(state, summary.get("Status") or ""))
+        for name in summary.get("Names") or ():
+            out[name.lstrip("/")] = entry
+    return out
+
+
+def _container_status(
+    container_name: str, states: Dict[str, ContainerState]
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    Return (mapped_status, raw_dict) for a container by name, looked up in a
+    {name: (state, health)} snapshot (see _list_containers() and _STATE).
     If the container does not exist, returns ("unknown", {}).
     """
-    try:
-        c = docker_client.containers.get(container_name)
-    except NotFound:
+    entry = states.get(container_name)
+    if entry is None:
         return "unknown", {}
 
-    state = getattr(c, "status", None)  # e.g. "running"
-    health = c.attrs.get("State", {}).get("Health", {}).get("Status")
-    mapped = _map_status(state or "unknown", health)
+    state, health = entry
+    mapped = _map_status(state, health)
     raw = {"status": state, "health": health}
     return mapped, raw
 
 
+def _container_states() -> Dict[str, ContainerState]:
+    """
+    Return a {name: (state, health)} snapshot, from the events-fed _STATE when
+    the watcher is live, otherwise straight from Docker.
+    """
+    if not _FIRST_SEED_DONE.is_set():
+        _FIRST_SEED_DONE.wait(timeout=COLD_START_WAIT)
+    if _STATE_READY.is_set():
+        with _STATE_LOCK:
+            return dict(_STATE)
+    return _list_containers()
+
+
+def _apply_event(event: Dict[str, Any]) -> None:
+    """Update _STATE from a single Docker container event."""
+    name = event.get("Actor", {}).get("Attributes", {}).get("name")
+    if name not in ALLOWED:
+        return
+    action = event.get("Action") or event.get("status") or ""
+
+    # A "die" under a restart policy leaves the container "restarting" and no
+    # later event says so: ask Docker for the real state (outside the lock).
+    died_state = None
+    if action == "die":
+        try:
+            died_state = docker_client.api.inspect_container(name)["State"]["Status"]
+        except APIError:
+            pass
+
+    with _STATE_LOCK:
+        current = _STATE.get(name)
+        if action.startswith("health_status: "):
+            state = current[0] if current else "running"
+            _STATE[name] = (state, action[len("health_status: "):])
+            _HAS_HEALTHCHECK.add(name)
+        elif action == "destroy":
+            _STATE.pop(name, None)
+            # A recreated container may come with a different healthcheck.
+            _HAS_HEALTHCHECK.discard(name)
+        else:
+            state = died_state or _EVENT_STATES.get(action)
+            if state is None:
+                return
+            health = current[1] if current else None
+            if action == "start":
+                # Health checks restart from scratch on every start.
+                health = "starting" if name in _HAS_HEALTHCHECK else None
+            elif action in ("die", "stop"):
+                health = None
+            _STATE[name] = (state, health)
+        for wanted, waiter in _WAITERS.get(name, ()):
+            if wanted == action:
+                waiter.set()
+    _invalidate_status_cache()
+
+
+def _wait_for_action(name: str, action: str, waiter: threading.Event) -> None:
+    """
+    Block until Docker confirms `action` on container `name` (or timeout).
+    Uses the events-fed _STATE when live, otherwise polls the container with
+    exponential backoff.
+    """
+    targets = _ACTION_STATES.get(action)
+    if _STATE_READY.is_set():
+        if targets is not None:
+            with _STATE_LOCK:
+                entry = _STATE.get(name)
+            if entry is not None and entry[0] in targets:
+                return
+        waiter.wait(timeout=ACTION_CONFIRM_TIMEOUT)
+        return
+
+    if targets is None:
+        # Docker's restart call only returns once the container is back up.
+        return
+    deadline = time.monotonic() + ACTION_CONFIRM_TIMEOUT
+    delay = 0.02
+    while time.monotonic() < deadline:
+        try:
+            state = docker_client.api.inspect_container(name)["State"]["Status"]
+        except (NotFound, APIError):
+            return
+        if state in targets:
+            return
+        time.sleep(delay)
+        delay = min(delay * 2, 0.2)
+
+
+def _meminfo_field(data: bytes, key: bytes) -> int:
+    """Return a /proc/meminfo field (e.g. b"MemTotal:") in bytes."""
+    # Match at a line start so b"Cached:" does not hit b"SwapCached:".
+    if data.startswith(key):
+        start = 0
+    else:
+        start = data.find(b"\n" + key)
+        if start < 0:
+            raise KeyError(key.decode())
+        start += 1
+    start += len(key)
+    end = data.find(b"kB", start)
+    return int(data[start:end]) * 1024
+
+
+def _read_meminfo() -> Dict[str, int]:
+    """
+    Read RAM figures from host /proc/meminfo with a single read().
+    "used" counts everything not available to new allocations.
+    """
+    with open(MEMINFO_PATH, "rb") as f:
+        data = f.read()
+    total = _meminfo_field(data, b"MemTotal:")
+    try:
+        available = _meminfo_field(data, b"MemAvailable:")
+    except KeyError:
+        # Kernels before 3.14 lack MemAvailable; estimate it like psutil does.
+        available = (
+            _meminfo_field(data, b"MemFree:")
+            + _meminfo_field(data, b"Buffers:")
+            + _meminfo_field(data, b"Cached:")
+        )
+    return {
+        "total": total,
+        "used": total - available,
+        "free": available,
+        "percent": 100.0 * (1 - available / total),
+    }
+
+
+def _invalidate_status_cache() -> None:
+    """Force the next /api/status call to query Docker again."""
+    with _STATUS_LOCK:
+        _STATUS_CACHE["ts"] = float("-inf")
+        _STATUS_CACHE["gen"] += 1
+
+
+# In-flight computations shared by concurrent requests (see _single_flight()).
+_INFLIGHT: Dict[str, Future] = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+
+def _single_flight(key: str, fn: Callable[[], Any]) -> Any:
+    """
+    Run fn() once for all concurrent callers using the same key: the first
+    caller computes, the others wait for and share its result (or exception).
+    """
+    with _INFLIGHT_LOCK:
+        future = _INFLIGHT.get(key)
+        leader = future is None
+        if leader:
+            future = _INFLIGHT[key] = Future()
+    if not leader:
+        return future.result()
+
+    try:
+        result = fn()
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        with _INFLIGHT_LOCK:
+            del _INFLIGHT[key]
+
+
+def _build_status_body(gen: int) -> bytes:
+    """
+    Assemble, encode and cache the /api/status payload. `gen` is the cache
+    generation read before the snapshot is taken.
+    """
+    states = _container_states()
+    out: Dict[str, Dict[str, Any]] = {}
+    for key, name in _VISIBLE:
+        mapped, raw = _container_status(name, states)
+        if raw:
+            out[key] = {"state": mapped, "raw": raw}
+        else:
+            out[key] = _UNKNOWN_SERVICE
+
+    # Cache the encoded body so cache hits skip serialization entirely.
+    body = orjson.dumps(out)
+    with _STATUS_LOCK:
+        # Skip caching if an invalidation raced with the snapshot above.
+        if _STATUS_CACHE["gen"] == gen:
+            _STATUS_CACHE["ts"] = time.monotonic()
+            _STATUS_CACHE["body"] = body
+    return body
+
+
+def _collect_sysinfo() -> Dict[str, Any]:
+    """
+    Gather the /api/sysinfo payload.
+    Raises RuntimeError with a client-facing message on failure.
+    """
+    # Disk usage (HOSTFS_PATH should be a mount of the host filesystem root)
+    try:
+        st = os.statvfs(f"{HOSTFS_PATH}/")
+    except FileNotFoundError:
+        raise RuntimeError(f"Host filesystem mount not found at {HOSTFS_PATH}/")
+    except OSError as e:
+        raise RuntimeError(f"Failed to read disk usage: {e}")
+    # Same figures as psutil.disk_usage(): "free" is what unprivileged users can
+    # still write, "percent" ignores blocks reserved for root.
+    disk_total = st.f_blocks * st.f_frsize
+    disk_used = (st.f_blocks - st.f_bfree) * st.f_frsize
+    disk_free = st.f_bavail * st.f_frsize
+    disk_pct = 100.0 * disk_used / (disk_used + disk_free) if disk_used + disk_free else 0.0
+
+    # RAM from host /proc/meminfo
+    try:
+        vm = _read_meminfo()
+    except Exception as e:
+        raise RuntimeError(f"Failed to read RAM stats: {e}")
+
+    # CPU is sampled in the background by _cpu_sampler()
+    cpu_pct = _LAST_CPU_PCT
+
+    # Load averages: prefer os.getloadavg(); fallback to reading LOADAVG_PATH
+    load1 = load5 = load15 = None
+    try:
+        load1, load5, load15 = os.getloadavg()
+    except Exception:
+        try:
+            with open(LOADAVG_PATH, "rb") as f:
+                parts = f.read().split()
+                load1, load5, load15 = map(float, parts[:3])
+        except Exception:
+            # Keep None if not available (e.g., on non-Unix systems)
+            pass
+
+    return {
+        "disk": {
+            "path": HOSTFS_PATH,
+            "total": disk_total,
+            "used": disk_used,
+            "free": disk_free,
+            "percent": disk_pct,
+        },
+        "ram": {
+            "total": vm["total"],
+            "used": vm["used"],
+            "free": vm["free"],
+            "percent": vm["percent"],
+        },
+        "cpu": {
+            "percent": cpu_pct,
+            "load1": load1,
+            "load5": load5,
+            "load15": load15,
+        },
+    }
+
+
+def _humanize(n: int) -> str:
+    """Format a byte count with binary units, e.g. 2199023255552 -> "2.0 TiB"."""
+    value = float(n)
+    for unit in ("B", "KiB", "MiB", "GiB", "TiB"):
+        # Compare the displayed value so 1023.99 KiB becomes "1.0 MiB".
+        if round(value, 1) < 1024:
+            return f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} PiB"
+
+
+def _humanize_sysinfo(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a copy of a sysinfo payload with byte counts as display strings."""
+    out = {}
+    for section, fields in payload.items():
+        out[section] = {
+            name: _humanize(value) if name in ("total", "used", "free") else value
+            for name, value in fields.items()
+        }
+        if "percent" in fields:
+            out[section]["percent"] = round(fields["percent"], 1)
+    return out
+
+
 def _json_error(status_code: int, message: str):
     """Return a JSON error with the given HTTP status code."""
     payload = {"ok": False, "error": {"code": status_code, "message": message}}
     return make_response(jsonify(payload), status_code)
 
 
+# -----------------------------------------------------------------------------
+# Background workers
+# -----------------------------------------------------------------------------
+
+def _cpu_sampler() -> None:
+    """
+    Keep _LAST_CPU_PCT up to date so requests never block on a CPU sample.
+    psutil.cpu_percent(interval=...) sleeps for the whole interval.
+    """
+    global _LAST_CPU_PCT
+    while True:
+        try:
+            _LAST_CPU_PCT = psutil.cpu_percent(interval=CPU_SAMPLE_INTERVAL)
+        except Exception:
+            # Keep the last value and retry on the next tick.
+            app.logger.exception("CPU sampling failed")
+            time.sleep(CPU_SAMPLE_INTERVAL)
+
+
+def _events_watcher() -> None:
+    """
+    Maintain _STATE from the Docker events stream so /api/status never has to
+    query the daemon. Reseeds from a full listing on every (re)connect.
+    """
+    while True:
+        try:
+            # Subscribe before seeding so no transition is missed in between.
+            events = docker_client.events(
+                decode=True, filters={"type": "container", "container": _VISIBLE_NAMES}
+            )
+            try:
+                seed = _list_containers()
+                with _STATE_LOCK:
+                    _STATE.clear()
+                    _STATE.update(seed)
+                    _HAS_HEALTHCHECK.update(
+                        name for name, (_, health) in seed.items() if health is not None
+                    )
+                _STATE_READY.set()
+                _FIRST_SEED_DONE.set()
+                _invalidate_status_cache()
+                for event in events:
+                    _apply_event(event)
+            finally:
+                events.close()
+        except Exception:
+            app.logger.exception(
+                "Docker events watcher failed; retrying in %.0fs", EVENTS_RETRY_DELAY
+            )
+        _FIRST_SEED_DONE.set()
+        # Stream ended or failed: fall back to direct queries until reconnected.
+        _STATE_READY.clear()
+        time.sleep(EVENTS_RETRY_DELAY)
+
+
+threading.Thread(target=_cpu_sampler, name="cpu-sampler", daemon=True).start()
+threading.Thread(target=_events_watcher, name="docker-events", daemon=True).start()
+
+
 # -----------------------------------------------------------------------------
 # Routes
 # -----------------------------------------------------------------------------
@@ -125,17 +589,18 @@ def status():
         ...
       }
     """
-    out: Dict[str, Dict[str, Any]] = {}
-    for key, meta in SERVICES.items():
-        name = meta["container"]
-        if name not in ALLOWED:
-            continue
-        mapped, raw = _container_status(name)
-        if raw:
-            out[key] = {"state": mapped, "raw": raw}
-        else:
-            out[key] = {"state": "unknown"}
-    return jsonify(out)
+    with _STATUS_LOCK:
+        if time.monotonic() - _STATUS_CACHE["ts"] < STATUS_TTL:
+            return app.response_class(_STATUS_CACHE["body"], mimetype="application/json")
+        gen = _STATUS_CACHE["gen"]
+
+    # Keyed by generation: a poll arriving after an invalidation never joins a
+    # build whose snapshot predates it.
+    try:
+        body = _single_flight(f"status:{gen}", lambda: _build_status_body(gen))
+    except APIError as e:
+        return _json_error(502, f"Docker API error while listing containers: {e.explanation or str(e)}")
+    return app.response_class(body, mimetype="application/json")
 
 
 @app.post("/api/service/<key>/<action>")
@@ -159,23 +624,34 @@ def service_action(key: str, action: str):
     if name not in ALLOWED:
         return _json_error(403, f"Container '{name}' is not allowed.")
 
+    # Register before acting so the confirming event cannot be missed.
+    waiter = threading.Event()
+    with _STATE_LOCK:
+        _WAITERS.setdefault(name, []).append((action, waiter))
     try:
-        c = docker_client.containers.get(name)
-    except NotFound:
-        return _json_error(404, f"Container '{name}' not found.")
-
-    try:
-        if action == "restart":
-            c.restart()
-        elif action == "start":
-            c.start()
-        elif action == "stop":
-            c.stop()
-    except APIError as e:
-        return _json_error(502, f"Docker API error while '{action}' on '{name}': {e.explanation or str(e)}")
-
-    # Small delay to let state propagate before the client re-polls status.
-    time.sleep(0.2)
+        # Act by name through the low-level API: a missing container surfaces
+        # as NotFound, so no inspect round-trip is needed beforehand.
+        try:
+            if action == "restart":
+                docker_client.api.restart(name)
+            elif action == "start":
+                docker_client.api.start(name)
+            elif action == "stop":
+                docker_client.api.stop(name)
+        except NotFound:
+            return _json_error(404, f"Container '{name}' not found.")
+        except APIError as e:
+            return _json_error(502, f"Docker API error while '{action}' on '{name}': {e.explanation or str(e)}")
+
+        # Let the new state propagate before the client re-polls status.
+        _wait_for_action(name, action, waiter)
+    finally:
+        with _STATE_LOCK:
+            pending = _WAITERS[name]
+            pending.remove((action, waiter))
+            if not pending:
+                del _WAITERS[name]
+    _invalidate_status_cache()
     return jsonify({"ok": True})
 
 
@@ -184,61 +660,18 @@ def sysinfo():
     """
     Return basic system metrics from the host:
       - disk usage for HOSTFS_PATH
-      - RAM usage (from host /proc via psutil)
-      - CPU percentage (short sample) and load averages
+      - RAM usage (from host /proc/meminfo)
+      - CPU percentage (last background sample) and load averages
+    Percentages are unrounded; with ?fmt=human byte counts are returned as
+    strings (e.g. "2.0 TiB") and percentages are rounded to one decimal.
     """
-    # Disk usage (HOSTFS_PATH should be a mount of the host filesystem root)
-    try:
-        du = psutil.disk_usage(f"{HOSTFS_PATH}/")
-    except FileNotFoundError:
-        return _json_error(500, f"Host filesystem mount not found at {HOSTFS_PATH}/")
-    except Exception as e:
-        return _json_error(500, f"Failed to read disk usage: {e}")
-
-    # RAM and CPU from host /proc (psutil respects PSUTIL_PROCFS_PATH)
     try:
-        vm = psutil.virtual_memory()
-        cpu_pct = psutil.cpu_percent(interval=0.1)
-    except Exception as e:
-        return _json_error(500, f"Failed to read RAM/CPU stats: {e}")
-
-    # Load averages: prefer os.getloadavg(); fallback to reading /hostproc/loadavg
-    load1 = load5 = load15 = None
-    try:
-        load1, load5, load15 = os.getloadavg()
-    except Exception:
-        try:
-            procfs = os.environ.get("PSUTIL_PROCFS_PATH", "/hostproc")
-            with open(os.path.join(procfs, "loadavg"), "r") as f:
-                parts = f.read().split()
-                load1, load5, load15 = map(float, parts[:3])
-        except Exception:
-            # Keep None if not available (e.g., on non-Unix systems)
-            pass
-
-    return jsonify(
-        {
-            "disk": {
-                "path": HOSTFS_PATH,
-                "total": du.total,
-                "used": du.used,
-                "free": du.free,
-                "percent": round(du.percent, 1),
-            },
-            "ram": {
-                "total": vm.total,
-                "used": vm.used,
-                "free": vm.available,
-                "percent": round(vm.percent, 1),
-            },
-            "cpu": {
-                "percent": round(cpu_pct, 1),
-                "load1": load1,
-                "load5": load5,
-                "load15": load15,
-            },
-        }
-    )
+        payload = _single_flight("sysinfo", _collect_sysinfo)
+    except RuntimeError as e:
+        return _json_error(500, str(e))
+    if request.args.get("fmt") == "human":
+        return jsonify(_humanize_sysinfo(payload))
+    return jsonify(payload)
 
 
 # -----------------------------------------------------------------------------
@@ -246,5 +679,6 @@ def sysinfo():
 # -----------------------------------------------------------------------------
 
 if __name__ == "__main__":
-    # Bind to loopback by default. Change to "0.0.0.0" if you need external access.
+    # Development server only; the container runs the app under gunicorn
+    # (see Dockerfile). Bind to loopback by default. Change to "0.0.0.0" if you need external access.
     app.run(host="127.0.0.1", port=5005)